@@ -1,13 +1,27 @@
 import os
-import requests
-import pdfkit
+import re
+import html as html_lib
+import argparse
+import json
+import atexit
+import time
+import shutil
+import hashlib
+import functools
+import itertools
+import threading
+import asyncio
 import subprocess
 import tempfile
-from PyPDF2 import PdfMerger, PdfReader
-from readability import Document
-import validators
+from io import BytesIO
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from collections import deque
+from contextlib import ExitStack
 from urllib.parse import urlparse
-from PIL import Image
+
+# Third-party modules are imported inside the features that use them, so
+# starting the menu (or merging PDFs) never pays for the blog/image stack
 
 # ---------------------------- Common Functions ------------------------------
 def clear_screen():
@@ -20,9 +34,10 @@ def show_menu():
     print("=== 📚 PDF Master ===")
     print("1. Merge PDF Files")
     print("2. Blog to PDF Converter")
-    print("3. Create PDF")
-    print("4. Exit")
-    choice = input("\nChoose an option (1-4): ")
+    print("3. Batch Blogs to PDF")
+    print("4. Create PDF")
+    print("5. Exit")
+    choice = input("\nChoose an option (1-5): ")
     return choice
 
 def create_pdf_menu():
@@ -50,7 +65,99 @@ def get_output_filename(default_name):
             continue
         return name
 
+@functools.lru_cache(maxsize=1)
+def cwd_index():
+    """Set of normcased filenames in the current directory"""
+    with os.scandir('.') as entries:
+        return {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+
+def is_file_in_cwd(filename):
+    """Check for a file in the current directory, rescanning once on a miss"""
+    name = os.path.normcase(filename)
+    if name in cwd_index():
+        return True
+    cwd_index.cache_clear()
+    # The stat fallback covers case-insensitive filesystems (such as macOS
+    # by default) where normcase leaves the name untouched
+    return name in cwd_index() or os.path.isfile(filename)
+
+def has_extension(filename, extensions):
+    """Check a filename's extension against a set of lowercase extensions"""
+    return os.path.splitext(filename)[1].lower() in extensions
+
+MAX_OPEN_SOURCES = 256     # Source PDFs held open before flushing a shard
+
+class ShardedMerger:
+    """Merge PDFs with pikepdf while keeping a bounded number of files open"""
+
+    def __init__(self):
+        import pikepdf
+        self.merged = pikepdf.Pdf.new()
+        self.sources = ExitStack()
+        self.open_count = 0
+        self.page_count = 0
+        self.shards = []
+        self.scratch = None
+
+    def append(self, source):
+        """Append a PDF's pages from a path or file object"""
+        import pikepdf
+        # QPDF copies page objects natively but reads their stream data from
+        # the source lazily, so sources stay open until their shard is saved
+        src = self.sources.enter_context(pikepdf.open(source))
+        self.open_count += 1
+        self.merged.pages.extend(src.pages)
+        self.page_count += len(src.pages)
+        if self.open_count >= MAX_OPEN_SOURCES:
+            self.flush()
+
+    def flush(self):
+        """Save the pages gathered so far to a scratch shard and close their sources"""
+        import pikepdf
+        if self.scratch is None:
+            self.scratch = tempfile.TemporaryDirectory()
+        shard = os.path.join(self.scratch.name, f"shard_{len(self.shards)}.pdf")
+        self.merged.save(shard)
+        self.shards.append(shard)
+        self.merged.close()
+        self.sources.close()
+        self.merged = pikepdf.Pdf.new()
+        self.sources = ExitStack()
+        self.open_count = 0
+
+    def save(self, output_filename):
+        """Write the merged document"""
+        if not self.shards:
+            save_pdf(self.merged, output_filename)
+            return
+        
+        import pikepdf
+        if self.open_count:
+            self.flush()
+        with pikepdf.Pdf.new() as final, ExitStack() as shard_sources:
+            for shard in self.shards:
+                final.pages.extend(shard_sources.enter_context(pikepdf.open(shard)).pages)
+            save_pdf(final, output_filename)
+
+    def close(self):
+        """Release open sources and scratch shards"""
+        self.merged.close()
+        self.sources.close()
+        if self.scratch is not None:
+            self.scratch.cleanup()
+
+def save_pdf(pdf, output_filename):
+    """Save a linearized PDF with compressed object streams"""
+    import pikepdf
+    pdf.save(
+        output_filename,
+        linearize=True,
+        object_stream_mode=pikepdf.ObjectStreamMode.generate
+    )
+
 # ---------------------------- PDF Merger Feature ----------------------------
+PDF_EXTENSIONS = frozenset({'.pdf'})
+
 def pdf_merger():
     """Handle PDF merging functionality"""
     clear_screen()
@@ -66,6 +173,7 @@ def pdf_merger():
 
 def get_file_names():
     """Collect and validate PDF filenames"""
+    cwd_index.cache_clear()
     file_names = []
     print("\n📁 Enter PDF filenames from current directory (type 'q' to finish):")
     
@@ -86,43 +194,162 @@ def get_file_names():
 
 def validate_pdf_file(filename):
     """Validate PDF file"""
+    import pikepdf
     if os.path.dirname(filename):
         raise ValueError("Please enter filename only")
-    if not os.path.exists(filename):
+    if not is_file_in_cwd(filename):
         raise FileNotFoundError(f"File '{filename}' not found")
-    if not filename.lower().endswith('.pdf'):
+    if not has_extension(filename, PDF_EXTENSIONS):
         raise ValueError("Not a PDF file")
-    with open(filename, 'rb') as f:
-        PdfReader(f)
+    pikepdf.open(filename).close()
 
 def merge_pdfs(file_paths, output_filename):
     """Merge PDF files with error handling"""
-    merger = PdfMerger()
+    import pikepdf
+    ghostscript = shutil.which('gs')
+    merger = None if ghostscript else ShardedMerger()
+    valid_paths = []
     error_count = 0
 
     for file_path in file_paths:
         try:
-            merger.append(file_path)
+            if merger is None:
+                pikepdf.open(file_path).close()
+            else:
+                merger.append(file_path)
+            valid_paths.append(file_path)
             print(f"✅ Added: {file_path}")
         except Exception as e:
             print(f"❌ Failed {file_path}: {str(e)}")
             error_count += 1
 
     try:
-        with open(output_filename, 'wb') as f:
-            merger.write(f)
+        merged_by_gs = False
+        if merger is None and valid_paths:
+            try:
+                merge_with_ghostscript(ghostscript, valid_paths, output_filename)
+                merged_by_gs = True
+            except subprocess.CalledProcessError as e:
+                print(f"⚠️  Ghostscript failed ({str(e)}), merging with pikepdf instead")
+                if os.path.exists(output_filename):
+                    os.remove(output_filename)
+        
+        if not merged_by_gs:
+            if merger is None:
+                merger = ShardedMerger()
+                for file_path in valid_paths:
+                    merger.append(file_path)
+            merger.save(output_filename)
         print(f"\n🎉 Successfully created: {output_filename}")
         print(f"📊 Stats: {len(file_paths)-error_count} succeeded, {error_count} failed")
     except Exception as e:
         print(f"\n🔥 Critical error: {str(e)}")
     finally:
-        merger.close()
+        if merger is not None:
+            merger.close()
+
+def merge_with_ghostscript(ghostscript, file_paths, output_filename):
+    """Merge PDFs in Ghostscript, which streams pages with flat memory use"""
+    subprocess.run([
+        ghostscript,
+        '-q', '-dNOPAUSE', '-dBATCH', '-dSAFER',
+        '-sDEVICE=pdfwrite',
+        '-dPDFSETTINGS=/prepress',
+        '-dDetectDuplicateImages=true',
+        '-dCompressFonts=true',
+        # '%' is a page-number format specifier in Ghostscript output names
+        f"-sOutputFile={output_filename.replace('%', '%%')}",
+        # Absolute paths so a name starting with '-' is never read as a switch
+        *(os.path.abspath(path) for path in file_paths)
+    ], check=True)
 
 # ------------------------- Blog to PDF Feature ------------------------------
+# Base-14 font families only, so the renderer never has to resolve or embed
+# web fonts
+PDF_STYLES = """
+    body { font-family: Helvetica, Arial, sans-serif; line-height: 1.6; margin: 2cm; }
+    img { max-width: 100%; height: auto; }
+    pre { background: #f4f4f4; padding: 10px; overflow: auto; }
+    code { font-family: Courier, monospace; }
+    h1, h2, h3 { color: #2c3e50; }
+    a { color: #3498db; text-decoration: none; }
+"""
+HTML_TEMPLATE = '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>{body}</body></html>'
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdf_master')
+
+URL_PATTERN = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+BLOG_INDICATORS = frozenset({
+    '/blog/', '/post/', '/article/',
+    'medium.com', 'wordpress.com', 'blogspot'
+})
+
+pdf_engine = 'weasyprint'   # Set to 'chrome' by --engine chrome
+# Playwright's sync API is bound to the thread that started it, so the warm
+# browser lives on a dedicated single worker thread
+chrome_executor = None
+chrome_playwright = None
+chrome_browser = None
+
+BATCH_PARALLEL = 8          # Concurrent downloads in a batch
+DOMAIN_DELAY = 1.0          # Seconds between requests to the same host
+
+@functools.lru_cache(maxsize=1)
+def pdf_stylesheet():
+    """WeasyPrint stylesheet and the font configuration it was parsed with"""
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+    font_config = FontConfiguration()
+    return CSS(string=PDF_STYLES, font_config=font_config), font_config
+
+def warm_up_renderer():
+    """Load WeasyPrint and parse the stylesheet while the user is typing"""
+    def warm_up():
+        try:
+            pdf_stylesheet()
+        except Exception:
+            # Stay quiet over the prompt; the real render reports the error
+            pass
+    
+    if pdf_engine == 'weasyprint':
+        threading.Thread(target=warm_up, daemon=True).start()
+
+@functools.lru_cache(maxsize=1)
+def http_headers():
+    """Request headers, advertising brotli only when httpx can decode it"""
+    encodings = 'gzip, deflate'
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        encodings = 'br, ' + encodings
+        break
+    return {'Accept-Encoding': encodings, 'User-Agent': 'PDF-Master/1.0'}
+
+@functools.lru_cache(maxsize=1)
+def http2_available():
+    """Whether the h2 package httpx needs for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+@functools.lru_cache(maxsize=1)
+def http_client():
+    """Keep-alive client (HTTP/2 when available) shared by every conversion in the session"""
+    import httpx
+    client = httpx.Client(http2=http2_available(), headers=http_headers(), timeout=10.0,
+                          follow_redirects=True)
+    atexit.register(client.close)
+    return client
+
 def blog_to_pdf():
     """Handle blog to PDF conversion"""
     clear_screen()
     print("=== ✨ Blog to PDF Converter ===")
+    warm_up_renderer()
     url = get_valid_url()
     
     if not url:
@@ -141,7 +368,7 @@ def get_valid_url():
         if url.lower() == 'q':
             return None
             
-        if not validators.url(url):
+        if not URL_PATTERN.match(url):
             print("❌ Invalid URL format")
             continue
             
@@ -156,57 +383,301 @@ def get_valid_url():
 def is_blog_url(url):
     """Basic heuristic to detect blog URLs"""
     parsed = urlparse(url)
-    path = parsed.path.lower()
-    
-    blog_indicators = [
-        '/blog/', '/post/', '/article/',
-        'medium.com', 'wordpress.com', 'blogspot'
-    ]
-    
-    return any(indicator in path or indicator in parsed.netloc 
-              for indicator in blog_indicators)
+    haystack = parsed.path.lower() + '|' + parsed.netloc.lower()
+    return any(indicator in haystack for indicator in BLOG_INDICATORS)
 
 def convert_blog(url, output_filename):
     """Convert blog post to PDF"""
     try:
         print("\n⏳ Downloading content...")
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        print("🔍 Processing content...")
-        doc = Document(response.text)
-        content = doc.summary()
+        entry = load_page_cache(url)
+        response = http_client().get(url, headers=conditional_headers(entry))
+        html = cached_page(url, entry, response)
         
         print("🛠  Generating PDF...")
-        styled_content = add_pdf_styles(content)
-        pdfkit.from_string(styled_content, output_filename, options={
-            'encoding': 'UTF-8',
-            'quiet': ''
-        })
+        title = render_blog(url, html, output_filename)
         
         print(f"\n🎉 Successfully created: {output_filename}")
-        print(f"📄 Article title: {doc.title()}")
+        print(f"📄 Article title: {title}")
         
     except Exception as e:
         print(f"\n🔥 Conversion failed: {str(e)}")
         if os.path.exists(output_filename):
             os.remove(output_filename)
 
+def render_blog(url, html, output_filename):
+    """Extract the article from a page and render it to PDF, returning its title"""
+    import trafilatura
+    from trafilatura.metadata import extract_metadata
+    content = trafilatura.extract(
+        html,
+        url=url,
+        output_format='html',
+        include_images=True,
+        include_links=True
+    )
+    if not content:
+        raise ValueError("No article content found")
+    metadata = extract_metadata(html, default_url=url)
+    title = metadata.title if metadata and metadata.title else url
+    styled_content = add_pdf_styles(content)
+    
+    cache_key = pdf_engine + url + PDF_STYLES + styled_content
+    content_hash = hashlib.sha256(cache_key.encode()).hexdigest()
+    cached_pdf = cache_path('pdfs', content_hash + '.pdf')
+    if cached_pdf and os.path.exists(cached_pdf):
+        try:
+            shutil.copyfile(cached_pdf, output_filename)
+            return title
+        except OSError:
+            pass
+    
+    if pdf_engine == 'chrome':
+        chrome_executor.submit(render_with_chrome, url, styled_content, output_filename).result()
+    else:
+        from weasyprint import HTML
+        stylesheet, font_config = pdf_stylesheet()
+        HTML(string=styled_content, base_url=url).write_pdf(
+            output_filename,
+            stylesheets=[stylesheet],
+            font_config=font_config
+        )
+    if cached_pdf:
+        with open(output_filename, 'rb') as f:
+            write_cache_file(cached_pdf, f.read())
+    return title
+
+def start_chrome():
+    """Launch a headless Chrome that stays warm for the whole session"""
+    global chrome_executor
+    chrome_executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        chrome_executor.submit(launch_chrome).result()
+    except Exception:
+        chrome_executor.shutdown()
+        chrome_executor = None
+        raise
+
+def launch_chrome():
+    """Start Playwright and Chromium (runs on the Chrome worker thread)"""
+    global chrome_playwright, chrome_browser
+    from playwright.sync_api import sync_playwright
+    chrome_playwright = sync_playwright().start()
+    chrome_browser = chrome_playwright.chromium.launch(
+        headless=True,
+        args=['--no-sandbox', '--disable-dev-shm-usage']
+    )
+
+def render_with_chrome(url, styled_content, output_filename):
+    """Print a document to PDF in a fresh tab of the warm browser"""
+    base_tag = f'<base href="{html_lib.escape(url)}">'
+    page = chrome_browser.new_page()
+    try:
+        page.set_content(styled_content.replace('<head>', '<head>' + base_tag, 1),
+                         wait_until='networkidle')
+        page.add_style_tag(content=PDF_STYLES)
+        page.pdf(path=output_filename, format='A4', print_background=True)
+    finally:
+        page.close()
+
+def close_chrome():
+    """Close Chromium and Playwright (runs on the Chrome worker thread)"""
+    chrome_browser.close()
+    chrome_playwright.stop()
+
+def stop_chrome():
+    """Shut down the warm browser and its worker thread"""
+    # Called from the main flow rather than atexit: Python shuts executors
+    # down before atexit hooks run, so close_chrome could no longer be queued
+    if chrome_executor is None:
+        return
+    try:
+        chrome_executor.submit(close_chrome).result()
+    finally:
+        chrome_executor.shutdown()
+
+def cache_path(kind, name):
+    """Path of a cache entry, or None if the cache directory is unusable"""
+    directory = os.path.join(CACHE_DIR, kind)
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    return os.path.join(directory, name)
+
+def write_cache_file(cache_file, data):
+    """Write bytes into the cache atomically; caching is best-effort"""
+    try:
+        fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file))
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+def page_cache_file(url):
+    """Cache entry holding a page's body and validators, or None"""
+    return cache_path('pages', hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+def load_page_cache(url):
+    """Cached body and validators for a page, or None"""
+    cache_file = page_cache_file(url)
+    if cache_file is None:
+        return None
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def conditional_headers(entry):
+    """Revalidation headers for a previously downloaded page"""
+    headers = {}
+    if entry and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def cached_page(url, entry, response):
+    """Page body from a response, served from the cache entry on 304 Not Modified"""
+    if response.status_code == 304 and entry:
+        return entry['body']
+    
+    response.raise_for_status()
+    body = response.text
+    if response.headers.get('ETag') or response.headers.get('Last-Modified'):
+        cache_file = page_cache_file(url)
+        if cache_file:
+            write_cache_file(cache_file, json.dumps({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'body': body
+            }).encode('utf-8'))
+    return body
+
+def batch_blog_to_pdf():
+    """Handle conversion of several blog posts at once"""
+    clear_screen()
+    print("=== ✨ Batch Blog to PDF Converter ===")
+    warm_up_renderer()
+    urls = get_blog_urls()
+    
+    if not urls:
+        print("\n⚠️  No valid URLs entered. Returning to menu.")
+        return
+    
+    stem = os.path.splitext(get_output_filename("blog_post.pdf"))[0]
+    jobs = [(url, f"{stem}_{index}.pdf") for index, url in enumerate(urls, 1)]
+    
+    print(f"\n⏳ Downloading {len(jobs)} posts...")
+    results = asyncio.run(fetch_all(jobs))
+    
+    error_count = 0
+    for (url, output_filename), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            print(f"❌ Failed {url}: {str(result)}")
+            error_count += 1
+            if os.path.exists(output_filename):
+                os.remove(output_filename)
+        else:
+            print(f"✅ {output_filename}: {result}")
+    
+    print(f"\n📊 Stats: {len(jobs)-error_count} succeeded, {error_count} failed")
+
+def get_blog_urls():
+    """Collect and validate several blog URLs"""
+    urls = []
+    print("\n🌐 Enter blog post URLs (type 'q' to finish):")
+    
+    while True:
+        url = input("> ").strip()
+        
+        if url.lower() == 'q':
+            break
+            
+        if not URL_PATTERN.match(url):
+            print("❌ Invalid URL format")
+            continue
+            
+        if not is_blog_url(url):
+            print("⚠️  This doesn't appear to be a blog post URL")
+            proceed = input("Continue anyway? (y/n): ").lower()
+            if proceed != 'y':
+                continue
+                
+        urls.append(url)
+        print(f"✅ Added: {url}")
+
+    return urls
+
+class DomainRateLimiter:
+    """Space out requests that go to the same host"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.next_slot = {}
+        self.lock = asyncio.Lock()
+
+    async def wait(self, url):
+        domain = urlparse(url).netloc
+        async with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(domain, now))
+            self.next_slot[domain] = slot + self.delay
+        await asyncio.sleep(slot - now)
+
+async def fetch_all(jobs):
+    """Download and render (url, output) jobs concurrently, returning titles or errors"""
+    import httpx
+    semaphore = asyncio.Semaphore(BATCH_PARALLEL)
+    limiter = DomainRateLimiter(DOMAIN_DELAY)
+    limits = httpx.Limits(max_connections=BATCH_PARALLEL)
+    loop = asyncio.get_running_loop()
+    # Renders are CPU-bound and share one WeasyPrint font configuration,
+    # which is not thread-safe, so they run one at a time on their own thread
+    renderer = ThreadPoolExecutor(max_workers=1)
+    
+    async with httpx.AsyncClient(http2=http2_available(), headers=http_headers(), limits=limits,
+                                 timeout=10.0, follow_redirects=True) as client:
+        async def convert(url, output_filename):
+            # Wait for the host's slot first so a sleeping request never
+            # holds a download slot other hosts could use
+            await limiter.wait(url)
+            entry = load_page_cache(url)
+            async with semaphore:
+                response = await client.get(url, headers=conditional_headers(entry))
+            html = cached_page(url, entry, response)
+            # Render off the event loop so other downloads keep going
+            return await loop.run_in_executor(
+                renderer, render_blog, url, html, output_filename
+            )
+        
+        try:
+            return await asyncio.gather(
+                *(convert(url, output_filename) for url, output_filename in jobs),
+                return_exceptions=True
+            )
+        finally:
+            renderer.shutdown()
+
 def add_pdf_styles(html_content):
-    """Add PDF-friendly CSS styles"""
-    styles = """
-    <style>
-        body { font-family: Arial, sans-serif; line-height: 1.6; margin: 2cm; }
-        img { max-width: 100%; height: auto; }
-        pre { background: #f4f4f4; padding: 10px; overflow: auto; }
-        code { font-family: Monaco, Consolas, monospace; }
-        h1, h2, h3 { color: #2c3e50; }
-        a { color: #3498db; text-decoration: none; }
-    </style>
-    """
-    return f"{styles}\n{html_content}"
+    """Wrap content in a UTF-8 document styled by pdf_stylesheet()"""
+    return HTML_TEMPLATE.format(body=html_content)
 
 # ------------------------ Image to PDF Feature ------------------------------
+IMAGE_DPI = 100
+# Longest A4 side at IMAGE_DPI; any larger and the extra pixels are never seen
+MAX_IMAGE_SIDE = round(11.69 * IMAGE_DPI)
+JPEG_QUALITY = 85
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.bmp'})
+
 def image_to_pdf():
     """Handle image to PDF conversion"""
     clear_screen()
@@ -222,6 +693,7 @@ def image_to_pdf():
 
 def get_image_files():
     """Collect and validate image filenames"""
+    cwd_index.cache_clear()
     file_names = []
     print("\n📷 Enter image filenames (type 'q' to finish):")
     
@@ -242,12 +714,12 @@ def get_image_files():
 
 def validate_image_file(filename):
     """Validate image file"""
+    from PIL import Image
     if os.path.dirname(filename):
         raise ValueError("Please enter filename only")
-    if not os.path.exists(filename):
+    if not is_file_in_cwd(filename):
         raise FileNotFoundError(f"File '{filename}' not found")
-    valid_extensions = ('.jpg', '.jpeg', '.png', '.webp', '.bmp')
-    if not filename.lower().endswith(valid_extensions):
+    if not has_extension(filename, IMAGE_EXTENSIONS):
         raise ValueError("Not a supported image file")
     try:
         with Image.open(filename) as img:
@@ -255,53 +727,160 @@ def validate_image_file(filename):
     except Exception as e:
         raise ValueError(f"Invalid image file: {str(e)}")
 
+def prepare_image(path):
+    """Decode, downscale and re-encode an image as JPEG bytes (runs in a worker process)"""
+    from PIL import Image
+    try:
+        with Image.open(path) as img:
+            has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+            # Palette and bilevel images only resize with NEAREST and a
+            # transparency key would not survive resampling, so convert those
+            # first; everything else is downscaled before converting
+            if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'CMYK') or 'transparency' in img.info:
+                img = img.convert('RGBA' if has_alpha else 'RGB')
+            img.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.LANCZOS)
+            if has_alpha:
+                # convert('RGB') would drop the alpha channel, so blend it
+                # onto white instead. numpy/numba are only loaded when needed
+                import numpy as np
+                from image_kernels import flatten_alpha
+                if img.mode != 'RGBA':
+                    img = img.convert('RGBA')
+                img = Image.fromarray(flatten_alpha(np.asarray(img)))
+            elif img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            buffer = BytesIO()
+            img.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+        return buffer.getvalue(), None
+    except Exception as e:
+        return None, str(e)
+
 def convert_images_to_pdf(image_paths, output_filename):
     """Convert images to PDF with error handling"""
-    images = []
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.utils import ImageReader
     try:
-        for path in image_paths:
-            try:
-                img = Image.open(path)
-                if img.mode == 'RGBA':
-                    img = img.convert('RGB')
-                images.append(img)
+        pdf = canvas.Canvas(output_filename, pagesize=A4)
+        page_count = 0
+        
+        # Decoding is CPU-bound, so spread it across processes. Only a small
+        # window of images is queued ahead of the page being drawn, so
+        # prepared JPEGs do not pile up in the pool. ReportLab still keeps
+        # every drawn image in memory until save(), so the PDF itself grows
+        # with the total size of the downscaled JPEGs
+        workers = os.cpu_count() or 1
+        remaining = iter(image_paths)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            queued = deque(
+                (path, executor.submit(prepare_image, path))
+                for path in itertools.islice(remaining, 2 * workers)
+            )
+            while queued:
+                path, future = queued.popleft()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    queued.append((next_path, executor.submit(prepare_image, next_path)))
+                
+                data, error = future.result()
+                if error:
+                    print(f"❌ Failed {path}: {error}")
+                    continue
+                pdf.drawImage(
+                    ImageReader(BytesIO(data)), 0, 0,
+                    width=A4[0], height=A4[1],
+                    preserveAspectRatio=True, anchor='c'
+                )
+                pdf.showPage()
+                page_count += 1
                 print(f"✅ Processed: {path}")
-            except Exception as e:
-                print(f"❌ Failed {path}: {str(e)}")
         
-        if not images:
+        if not page_count:
             print("⚠️  No valid images to convert")
             return
         
-        images[0].save(
-            output_filename,
-            save_all=True,
-            append_images=images[1:],
-            resolution=100.0
-        )
+        pdf.save()
         print(f"\n🎉 Successfully created: {output_filename}")
-        print(f"📸 Number of images converted: {len(images)}")
+        print(f"📸 Number of images converted: {page_count}")
         
     except Exception as e:
         print(f"\n🔥 Conversion failed: {str(e)}")
         if os.path.exists(output_filename):
             os.remove(output_filename)
-    finally:
-        for img in images:
-            img.close()
 
 # ------------------------ Office to PDF Features ----------------------------
+# RAM-backed scratch space on Linux so intermediate PDFs never touch the disk
+SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+OFFICE_BATCH_SIZE = 10      # Files per LibreOffice invocation
+
+OFFICE_HOST = '127.0.0.1'
+OFFICE_UNO_PORT = 2002      # LibreOffice's own UNO socket
+OFFICE_SERVER_PORT = 2003   # unoserver's XML-RPC endpoint
+office_client = None
+office_server_thread = None
+
+def libreoffice_major_version():
+    """Major version of the installed LibreOffice, or 0 if unknown"""
+    try:
+        result = subprocess.run(
+            ['libreoffice', '--version'],
+            capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.SubprocessError):
+        return 0
+    match = re.search(r'LibreOffice (\d+)', result.stdout)
+    return int(match.group(1)) if match else 0
+
+def start_office_server():
+    """Start one shared LibreOffice instance for every conversion in the session"""
+    global office_client
+    try:
+        from unoserver.client import UnoClient
+    except ImportError:
+        return
+    if not shutil.which('unoserver'):
+        return
+    if libreoffice_major_version() < 7:
+        return
+    
+    server = subprocess.Popen([
+        'unoserver',
+        '--interface', OFFICE_HOST,
+        '--port', str(OFFICE_SERVER_PORT),
+        '--uno-port', str(OFFICE_UNO_PORT)
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    atexit.register(stop_office_server, server)
+    office_client = UnoClient(server=OFFICE_HOST, port=OFFICE_SERVER_PORT)
+
+def ensure_office_server():
+    """Start the shared LibreOffice in the background on first office conversion"""
+    global office_server_thread
+    if office_server_thread is None:
+        # The version probe and server start overlap with the filename prompts
+        office_server_thread = threading.Thread(target=start_office_server, daemon=True)
+        office_server_thread.start()
+
+def stop_office_server(server):
+    """Shut down the shared LibreOffice instance"""
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
 def validate_office_file(filename, extensions, file_type):
     """Validate office file"""
     if os.path.dirname(filename):
         raise ValueError("Please enter filename only")
-    if not os.path.exists(filename):
+    if not is_file_in_cwd(filename):
         raise FileNotFoundError(f"File '{filename}' not found")
-    if not filename.lower().endswith(extensions):
+    if not has_extension(filename, extensions):
         raise ValueError(f"Not a supported {file_type} file")
 
 def get_office_files(extensions, file_type):
     """Collect and validate office filenames"""
+    cwd_index.cache_clear()
     file_names = []
     print(f"\n📁 Enter {file_type} filenames (type 'q' to finish):")
     
@@ -320,31 +899,85 @@ def get_office_files(extensions, file_type):
 
     return file_names
 
-def convert_office_to_pdf(input_path, temp_dir, file_type):
-    """Convert office file to PDF using LibreOffice"""
+def office_batches(files, batch_count):
+    """Group file indices into LibreOffice batches, spread over batch_count workers"""
+    size = min(OFFICE_BATCH_SIZE, -(-len(files) // batch_count))
+    batches = []
+    for index, file_path in enumerate(files):
+        stem = os.path.splitext(file_path)[0]
+        # Files sharing a stem would overwrite each other's PDF in one outdir
+        for batch, stems in batches:
+            if len(batch) < size and stem not in stems:
+                batch.append(index)
+                stems.add(stem)
+                break
+        else:
+            batches.append(([index], {stem}))
+    return [batch for batch, _ in batches]
+
+def convert_office_to_pdf(input_paths, temp_dir, file_type):
+    """Convert a batch of office files to PDF, returning a path, in-memory PDF or None per file"""
+    work_dir = os.path.abspath(tempfile.mkdtemp(dir=temp_dir))
+    generated_pdfs = [
+        os.path.join(work_dir, os.path.splitext(os.path.basename(path))[0] + '.pdf')
+        for path in input_paths
+    ]
+    results = [None] * len(input_paths)
+    failed = set()
+    
     try:
-        subprocess.run([
-            'libreoffice',
-            '--headless',
-            '--convert-to', 'pdf',
-            '--outdir', temp_dir,
-            input_path
-        ], check=True)
-        
-        base_name = os.path.splitext(os.path.basename(input_path))[0] + '.pdf'
-        generated_pdf = os.path.join(temp_dir, base_name)
+        if office_client is not None:
+            # The server hands the PDF back directly, so nothing is written
+            for index, input_path in enumerate(input_paths):
+                try:
+                    pdf_bytes = office_client.convert(
+                        inpath=os.path.abspath(input_path),
+                        convert_to='pdf'
+                    )
+                    results[index] = BytesIO(pdf_bytes)
+                except OSError as e:
+                    # Connection problems: hand the rest of the batch to the CLI
+                    print(f"⚠️  Office server unavailable, using LibreOffice directly: {str(e)}")
+                    break
+                except Exception as e:
+                    # The server is fine but this document is not; don't retry it
+                    print(f"❌ Error converting {input_path}: {str(e)}")
+                    failed.add(index)
         
-        if os.path.exists(generated_pdf):
-            return generated_pdf
-        raise RuntimeError(f"{file_type} conversion failed")
+        pending = [
+            input_path
+            for index, input_path in enumerate(input_paths)
+            if results[index] is None and index not in failed
+        ]
+        if pending:
+            # One LibreOffice start for the whole batch. A private profile per
+            # batch lets several instances run side by side instead of handing
+            # off to the first one
+            subprocess.run([
+                'libreoffice',
+                f'-env:UserInstallation={Path(work_dir, "profile").as_uri()}',
+                '--headless',
+                '--convert-to', 'pdf',
+                '--outdir', work_dir,
+                *pending
+            ], check=True)
     except Exception as e:
-        print(f"❌ Error converting {input_path}: {str(e)}")
-        return None
+        print(f"❌ Error converting {', '.join(input_paths)}: {str(e)}")
+    
+    for index, (input_path, generated_pdf) in enumerate(zip(input_paths, generated_pdfs)):
+        if results[index] is not None or index in failed:
+            continue
+        if os.path.exists(generated_pdf):
+            results[index] = generated_pdf
+        else:
+            print(f"❌ Error converting {input_path}: {file_type} conversion failed")
+    return results
 
 def handle_office_conversion(file_type, extensions, default_output):
     """Generic handler for office conversions"""
     clear_screen()
     print(f"=== 📄 {file_type} to PDF Converter ===")
+    ensure_office_server()
     files = get_office_files(extensions, file_type)
     
     if not files:
@@ -352,12 +985,28 @@ def handle_office_conversion(file_type, extensions, default_output):
         return
     
     output_name = get_output_filename(default_output)
-    merger = PdfMerger()
-    temp_dir = tempfile.TemporaryDirectory()
+    merger = ShardedMerger()
+    temp_dir = tempfile.TemporaryDirectory(dir=SCRATCH_DIR)
     error_count = 0
     
-    for file_path in files:
-        temp_pdf = convert_office_to_pdf(file_path, temp_dir.name, file_type)
+    # LibreOffice startup dominates each conversion, so convert files in
+    # batches and run the batches concurrently
+    temp_pdfs = [None] * len(files)
+    office_server_thread.join()
+    workers = os.cpu_count() or 1
+    batches = office_batches(files, workers)
+    with ThreadPoolExecutor(max_workers=min(len(batches), workers)) as executor:
+        futures = {
+            executor.submit(
+                convert_office_to_pdf, [files[i] for i in batch], temp_dir.name, file_type
+            ): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            for index, temp_pdf in zip(futures[future], future.result()):
+                temp_pdfs[index] = temp_pdf
+    
+    for file_path, temp_pdf in zip(files, temp_pdfs):
         if temp_pdf:
             try:
                 merger.append(temp_pdf)
@@ -368,13 +1017,12 @@ def handle_office_conversion(file_type, extensions, default_output):
         else:
             error_count += 1
     
-    if len(merger.pages) == 0:
-        print("⚠️  No valid PDFs generated. Exiting.")
-        return
-    
     try:
-        with open(output_name, 'wb') as f:
-            merger.write(f)
+        if merger.page_count == 0:
+            print("⚠️  No valid PDFs generated. Exiting.")
+            return
+        
+        merger.save(output_name)
         print(f"\n🎉 Successfully created: {output_name}")
         print(f"📊 Stats: {len(files)-error_count} succeeded, {error_count} failed")
     except Exception as e:
@@ -387,7 +1035,7 @@ def word_to_pdf():
     """Handle Word to PDF conversion"""
     handle_office_conversion(
         "Word", 
-        ('.docx', '.doc'), 
+        frozenset({'.docx', '.doc'}), 
         "word_merged.pdf"
     )
 
@@ -395,7 +1043,7 @@ def excel_to_pdf():
     """Handle Excel to PDF conversion"""
     handle_office_conversion(
         "Excel", 
-        ('.xlsx', '.xls'), 
+        frozenset({'.xlsx', '.xls'}), 
         "excel_merged.pdf"
     )
 
@@ -403,12 +1051,13 @@ def powerpoint_to_pdf():
     """Handle PowerPoint to PDF conversion"""
     handle_office_conversion(
         "PowerPoint", 
-        ('.pptx', '.ppt'), 
+        frozenset({'.pptx', '.ppt'}), 
         "powerpoint_merged.pdf"
     )
 
 # ------------------------ Main Program Flow -------------------------------
-if __name__ == "__main__":
+def run_menu():
+    """Main menu loop"""
     while True:
         choice = show_menu()
         
@@ -417,6 +1066,8 @@ if __name__ == "__main__":
         elif choice == '2':
             blog_to_pdf()
         elif choice == '3':
+            batch_blog_to_pdf()
+        elif choice == '4':
             while True:
                 sub_choice = create_pdf_menu()
                 if sub_choice == '1':
@@ -432,10 +1083,36 @@ if __name__ == "__main__":
                 else:
                     print("\n⚠️  Invalid choice!")
                 input("\nPress Enter to continue...")
-        elif choice == '4':
+        elif choice == '5':
             print("\n👋 Exiting...")
             break
         else:
             print("\n⚠️  Invalid choice!")
         
-        input("\nPress Enter to continue...")
\ No newline at end of file
+        input("\nPress Enter to continue...")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF Master")
+    parser.add_argument(
+        '--engine',
+        choices=('weasyprint', 'chrome'),
+        default='weasyprint',
+        help="HTML renderer for blog posts (chrome handles modern CSS better)"
+    )
+    args = parser.parse_args()
+    
+    if args.engine == 'chrome':
+        try:
+            import playwright  # noqa: F401
+        except ImportError:
+            parser.error("--engine chrome requires the playwright package")
+        pdf_engine = 'chrome'
+        try:
+            start_chrome()
+        except Exception as e:
+            parser.error(f"could not start Chrome: {str(e)}")
+    
+    try:
+        run_menu()
+    finally:
+        stop_chrome()
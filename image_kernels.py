@@ -0,0 +1,22 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def flatten_alpha(pixels, background=255):
+    """Blend an RGBA array onto a solid background, returning RGB"""
+    alpha = pixels[..., 3:4] / 255.0
+    return (pixels[..., :3] * alpha + background * (1 - alpha)).astype(np.uint8)
+
+if njit is not None:
+    # Serial on purpose: callers already run one worker process per CPU
+    @njit(cache=True)
+    def flatten_alpha(pixels, background=255):
+        """Blend an RGBA array onto a solid background, returning RGB"""
+        out = np.empty(pixels.shape[:2] + (3,), np.uint8)
+        for y in range(pixels.shape[0]):
+            alpha = pixels[y, :, 3:4] / 255.0
+            out[y] = (pixels[y, :, :3] * alpha + background * (1 - alpha)).astype(np.uint8)
+        return out